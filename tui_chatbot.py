@@ -1,9 +1,14 @@
 import asyncio
+import io
+import itertools
+import json
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import textwrap
 import os
-import requests
-import pyperclip
+import random
+import httpx
 
 from textual.app import App, ComposeResult
 from textual.widgets import (
@@ -39,24 +44,290 @@ OPENROUTER_MODELS = [
 
 DEFAULT_MODEL_INDEX = 0
 
+# Approximate token budget for the history sent with each request. Past 80%
+# of it, older turns are replaced with a heuristic summary.
+CONTEXT_BUDGET = 8000
+# Most recent messages always sent verbatim
+KEEP_RECENT = 10
 
-async def ask_ai_async(messages, model: str):
-    return await asyncio.to_thread(ask_ai_sync, messages, model)
+# SQLite file holding all conversations
+DB_PATH = "chats.db"
 
+# Max model requests in flight at once, and attempts per request on 429/5xx
+MAX_INFLIGHT = int(os.environ.get("TUI_MAX_INFLIGHT", "4"))
+MAX_ATTEMPTS = 5
 
-def ask_ai_sync(messages, model: str):
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "HTTP-Referer": "http://localhost",
-        "X-Title": "TUI Chatbot",
-        "Content-Type": "application/json",
-    }
+# Worker threads for clipboard, export and other blocking IO
+THREAD_POOL_SIZE = int(os.environ.get("THREAD_POOL_SIZE", "32"))
 
-    data = {"model": model, "messages": messages}
 
-    response = requests.post(OPENROUTER_URL, json=data, headers=headers)
-    response.raise_for_status()
-    return response.json()["choices"][0]["message"]["content"]
+# ==============================
+# Context trimming
+# ==============================
+
+# Capitalized words, numbers and dates are kept as keywords in the summary
+_KEYWORD_RE = re.compile(r"\b(?:[A-Z][\w-]+|\d{4}-\d{2}-\d{2}|\d+(?:[.,:/]\d+)*)\b")
+
+
+def heuristic_summary(heads) -> str:
+    """Condense older messages into excerpts and keywords, 5 messages per page.
+
+    heads yields (position, message) for the first 3 messages of each page,
+    newest first, e.g. from ConversationProxy.page_heads().
+    """
+    pages = []
+    budget = CONTEXT_BUDGET  # characters, i.e. ~25% of the token budget
+    # Walk pages newest first so the most recent context survives the cap
+    for _, group in itertools.groupby(heads, key=lambda head: head[0] // 5):
+        lines = []
+        keywords = []
+        for _, msg in reversed(list(group)):
+            who = "User" if msg["role"] == "user" else "Assistant"
+            excerpt = msg["content"].strip().split("\n", 1)[0][:80]
+            lines.append(f"- {who}: {excerpt}")
+            for word in _KEYWORD_RE.findall(msg["content"]):
+                if word not in keywords:
+                    keywords.append(word)
+        if keywords:
+            lines.append(f"  Keywords: {', '.join(keywords[:10])}")
+
+        page = "\n".join(lines)
+        budget -= len(page)
+        if budget < 0:
+            break
+        pages.append(page)
+
+    pages.reverse()
+    return "Summary of earlier conversation:\n" + "\n".join(pages)
+
+
+def build_context(conv):
+    """Messages to send to the model: the full history, or a summary plus recent turns."""
+    count = len(conv)
+    if count <= KEEP_RECENT or conv.estimate_tokens() <= 0.8 * CONTEXT_BUDGET:
+        return list(conv)
+    summary = {"role": "system", "content": heuristic_summary(conv.page_heads(count - KEEP_RECENT))}
+    return [summary] + conv.tail(KEEP_RECENT)
+
+
+# ==============================
+# Storage
+# ==============================
+
+class ChatStore:
+    """SQLite-backed store for all conversations."""
+
+    def __init__(self, path: str):
+        # Exports read from a worker thread; the event loop does all writes
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS conversations (
+                id INTEGER PRIMARY KEY,
+                created_at TEXT NOT NULL,
+                title TEXT
+            );
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY,
+                conv_id INTEGER NOT NULL REFERENCES conversations(id),
+                role TEXT NOT NULL,
+                content TEXT NOT NULL,
+                ts TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS messages_conv_id ON messages(conv_id, id);
+            """
+        )
+
+    def conversations(self):
+        """Stored conversations that have messages, as (proxy, title) pairs, oldest first."""
+        rows = self.db.execute(
+            """
+            SELECT id, title FROM conversations c
+            WHERE EXISTS (SELECT 1 FROM messages m WHERE m.conv_id = c.id)
+            ORDER BY id
+            """
+        ).fetchall()
+        return [(ConversationProxy(self.db, conv_id), title) for conv_id, title in rows]
+
+    def new_conversation(self):
+        """An empty conversation; its row is only inserted with the first message."""
+        return ConversationProxy(self.db)
+
+    def set_title(self, conv, title: str):
+        self.db.execute("UPDATE conversations SET title = ? WHERE id = ?", (title, conv.conv_id))
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+
+class ConversationProxy:
+    """One conversation's messages, read from SQLite on demand.
+
+    Messages are {"role": ..., "content": ...} dicts, as sent to the model.
+    """
+
+    def __init__(self, db, conv_id: int | None = None):
+        self.db = db
+        # None until the first append; "conv_id = NULL" then matches no rows
+        self.conv_id = conv_id
+        self._len = 0
+        if conv_id is not None:
+            self._len = db.execute(
+                "SELECT COUNT(*) FROM messages WHERE conv_id = ?", (conv_id,)
+            ).fetchone()[0]
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        cur = self.db.execute(
+            "SELECT role, content FROM messages WHERE conv_id = ? ORDER BY id", (self.conv_id,)
+        )
+        for role, content in cur:
+            yield {"role": role, "content": content}
+
+    def append(self, msg):
+        if self.conv_id is None:
+            cur = self.db.execute(
+                "INSERT INTO conversations (created_at) VALUES (?)",
+                (datetime.now().isoformat(timespec="seconds"),),
+            )
+            self.conv_id = cur.lastrowid
+        self.db.execute(
+            "INSERT INTO messages (conv_id, role, content, ts) VALUES (?, ?, ?, ?)",
+            (self.conv_id, msg["role"], msg["content"], datetime.now().isoformat(timespec="seconds")),
+        )
+        self.db.commit()
+        self._len += 1
+
+    def last(self, role: str):
+        """Content of the newest message with this role, or None."""
+        row = self.db.execute(
+            "SELECT content FROM messages WHERE conv_id = ? AND role = ? ORDER BY id DESC LIMIT 1",
+            (self.conv_id, role),
+        ).fetchone()
+        return row[0] if row else None
+
+    def tail(self, n: int):
+        """The last n messages, oldest first."""
+        rows = self.db.execute(
+            "SELECT role, content FROM messages WHERE conv_id = ? ORDER BY id DESC LIMIT ?",
+            (self.conv_id, n),
+        ).fetchall()
+        return [{"role": role, "content": content} for role, content in reversed(rows)]
+
+    def page(self, start: int, stop: int):
+        """Messages start..stop (exclusive) in conversation order."""
+        rows = self.db.execute(
+            "SELECT role, content FROM messages WHERE conv_id = ? ORDER BY id LIMIT ? OFFSET ?",
+            (self.conv_id, max(0, stop - start), start),
+        ).fetchall()
+        return [{"role": role, "content": content} for role, content in rows]
+
+    def page_heads(self, stop: int, page: int = 5, head: int = 3):
+        """(position, message) for the first `head` of every `page` messages before stop.
+
+        Yields newest first from a live cursor, so a caller that stops early
+        never reads the older rows' content.
+        """
+        cur = self.db.execute(
+            """
+            SELECT p.pos, m.role, m.content
+            FROM (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY id) - 1 AS pos
+                FROM messages WHERE conv_id = ?
+            ) p
+            JOIN messages m ON m.id = p.id
+            WHERE p.pos < ? AND p.pos % ? < ?
+            ORDER BY p.pos DESC
+            """,
+            (self.conv_id, stop, page, head),
+        )
+        for pos, role, content in cur:
+            yield pos, {"role": role, "content": content}
+
+    def estimate_tokens(self) -> int:
+        """Cheap token estimate for the whole conversation: ~4 characters per token."""
+        return self.db.execute(
+            "SELECT COALESCE(SUM(LENGTH(content) / 4), 0) FROM messages WHERE conv_id = ?",
+            (self.conv_id,),
+        ).fetchone()[0]
+
+
+# Built once; the API key doesn't change at runtime
+_HEADERS = {
+    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+    "HTTP-Referer": "http://localhost",
+    "X-Title": "TUI Chatbot",
+    "Content-Type": "application/json",
+}
+
+# Shared client: keeps HTTP/2 connections (and TLS sessions) alive between calls
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=60,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+)
+
+# Caps concurrent replies across conversations to stay under rate limits
+_sem = asyncio.Semaphore(MAX_INFLIGHT)
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+async def ask_ai_async(messages, model: str):
+    """Stream the reply from OpenRouter, yielding content deltas as they arrive."""
+    data = {"model": model, "messages": messages, "stream": True}
+
+    async with _sem:
+        for attempt in range(MAX_ATTEMPTS):
+            async with _client.stream("POST", OPENROUTER_URL, json=data, headers=_HEADERS) as response:
+                if response.status_code not in _RETRY_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        # SSE: skip keep-alive comments and blank separators
+                        if not line.startswith("data:"):
+                            continue
+                        payload = line[len("data:"):].strip()
+                        if payload == "[DONE]":
+                            break
+                        delta = json.loads(payload)["choices"][0].get("delta", {}).get("content")
+                        if delta:
+                            yield delta
+                    return
+
+            # Throttled or server error: back off with jitter and retry
+            await asyncio.sleep(min(30, 0.5 * 2 ** attempt) + random.random() * 0.25)
+
+
+def write_conversation(f, conv):
+    """Write conv to a text file object as "You: ..." / "Bot: ..." blocks."""
+    first = True
+    for m in conv:
+        if not first:
+            f.write("\n\n")
+        f.write("You: " if m["role"] == "user" else "Bot: ")
+        f.write(m["content"])
+        first = False
+
+
+def _copy(text: str):
+    # pyperclip probes for clipboard backends on import; defer it to first use
+    import pyperclip
+    pyperclip.copy(text)
+
+
+def copy_conversation(conv):
+    buf = io.StringIO()
+    write_conversation(buf, conv)
+    _copy(buf.getvalue())
+
+
+def export_conversation(filename: str, conv):
+    with open(filename, "w", encoding="utf-8", buffering=1 << 16) as f:
+        write_conversation(f, conv)
 
 
 # ==============================
@@ -71,42 +342,43 @@ class ChatMessage(Static):
         self.is_user = is_user
         self.timestamp = datetime.now().strftime("%H:%M")
 
-        # Create header and body widgets
-        self.header_widget = Static()
-        self.body_widget = Static()
-
         # Initial text
         self.body_text = text
 
-    def compose(self):
-        yield self.header_widget
-        yield self.body_widget
+        # Header never changes; the body reuses one Text + Panel across refreshes
+        who = "You" if is_user else "Bot"
+        avatar = "😃" if is_user else "🤖"
+        color = "cyan" if is_user else "yellow"
+        self._header = Text(f"{avatar} [{self.timestamp}] {who}", style=color)
+        self._border = "cyan" if is_user else "magenta"
+        self._body_text_obj = Text(text, style="white")
+        self._panel = Panel(self._body_text_obj, border_style=self._border, padding=(0, 1))
 
-    def on_mount(self):
-        who = "You" if self.is_user else "Bot"
-        avatar = "😃" if self.is_user else "🤖"
-        color = "cyan" if self.is_user else "yellow"
+        # Create header and body widgets
+        self.header_widget = Static(self._header)
+        self.body_widget = Static(self._panel)
 
-        header = Text(f"{avatar} [{self.timestamp}] {who}", style=color)
-        self.header_widget.update(header)
+        # Streaming appends are coalesced and flushed on a timer
+        self._dirty = False
 
-        self.update_body()
+    def compose(self):
+        yield self.header_widget
+        yield self.body_widget
 
     def update_body(self):
         """Refresh the body text inside the bubble."""
-        body = Text(self.body_text, style="white")
-        border_color = "cyan" if self.is_user else "magenta"
-
-        panel = Panel(
-            body,
-            border_style=border_color,
-            padding=(0, 1),
-        )
-        self.body_widget.update(panel)
+        self._body_text_obj.plain = self.body_text
+        self.body_widget.update(self._panel)
 
     def append_text(self, more: str):
-        """Append text during streaming and refresh bubble."""
+        """Append text during streaming; the bubble refreshes on the next flush."""
         self.body_text += more
+        if not self._dirty:
+            self._dirty = True
+            self.set_timer(0.05, self._flush)
+
+    def _flush(self):
+        self._dirty = False
         self.update_body()
 
 
@@ -120,17 +392,40 @@ class TypingIndicator(Static):
     """Animated 'bot is typing' indicator."""
     dots = reactive("")
 
+    def __init__(self):
+        super().__init__()
+        self._timer = None
+
     def on_mount(self):
-        self.set_interval(0.5, self.animate)
         self.display = False
 
+    def show(self):
+        self.display = True
+        # Only tick while visible so an idle app has no wakeups
+        if self._timer is None:
+            self._timer = self.set_interval(0.5, self.animate)
+
+    def hide(self):
+        self.display = False
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
     def animate(self):
-        if not self.display:
-            return
         self.dots = "." if self.dots == "..." else self.dots + "."
         self.update(f"[yellow]🤖 Bot is typing{self.dots}[/yellow]")
 
 
+class LoadOlderItem(Static):
+    """Placeholder at the top of the chat for messages that aren't mounted."""
+
+    def set_hidden(self, hidden: int):
+        self.update(f"[dim]▲ {hidden} older messages — press [b]o[/b] to load more[/dim]")
+
+    async def on_click(self):
+        await self.app.run_action("load_older")
+
+
 class ConversationItem(ListItem):
     """Sidebar item for a conversation."""
 
@@ -181,6 +476,11 @@ class ChatApp(App):
         padding: 0 1;
     }
 
+    LoadOlderItem {
+        content-align: center middle;
+        padding: 0 1 1 1;
+    }
+
     .sidebar-title {
         padding: 1 1 0 1;
         color: #00afff;
@@ -197,6 +497,7 @@ class ChatApp(App):
         ("m", "cycle_model", "Switch model"),
         ("n", "new_conversation", "New conversation"),
         ("e", "export_conversation", "Export conversation"),
+        ("o", "load_older", "Load older messages"),
         ("c", "copy_bot", "Copy last bot message"),
         ("y", "copy_user", "Copy last user message"),
         ("ctrl+c", "copy_all", "Copy entire conversation"),
@@ -207,10 +508,26 @@ class ChatApp(App):
     current_conversation = reactive(0)
     current_model_index = reactive(DEFAULT_MODEL_INDEX)
 
+    # Max chat bubbles mounted at once; older messages are paged in on demand
+    WINDOW = 50
+
     def __init__(self):
         super().__init__()
-        # Each conversation: list of {"role": "user"/"assistant", "content": str}
-        self.conversations = [[]]
+        self.store = ChatStore(DB_PATH)
+        stored = self.store.conversations() or [(self.store.new_conversation(), None)]
+        # Each conversation: ConversationProxy over {"role": "user"/"assistant", "content": str}
+        self.conversations = [conv for conv, _ in stored]
+        # Sidebar title per conversation, computed once from its first message
+        self._titles = [title for _, title in stored]
+        # Reopen the most recent conversation
+        self.current_conversation = len(self.conversations) - 1
+        # Index into the current conversation of the first mounted message
+        self._rendered_start = 0
+        self._older_item = None
+        # Replies still streaming, per conversation index: {"widget", "text"}
+        self._streaming = {}
+        # Conversation indexes with a reply still waiting for its first token
+        self._pending = set()
 
     # -------------
     # Composition
@@ -224,7 +541,7 @@ class ChatApp(App):
                 self.sidebar_title = Static("Conversations", classes="sidebar-title")
                 yield self.sidebar_title
                 yield Static(
-                    " To Select Options first click on terminal then [b]n[/b]=new  [b]m[/b]=model  [b]t[/b]=theme\n[b]e[/b]=export  [b]c/y/Ctrl+C[/b]=copy",
+                    " To Select Options first click on terminal then [b]n[/b]=new  [b]m[/b]=model  [b]t[/b]=theme\n[b]e[/b]=export  [b]c/y/Ctrl+C[/b]=copy  [b]o[/b]=older",
                     classes="sidebar-help",
                 )
                 self.sidebar_list = ListView()
@@ -242,12 +559,21 @@ class ChatApp(App):
         yield Footer()
 
     async def on_mount(self):
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="tui-io")
+        )
         self.update_sidebar_title()
-        self.refresh_sidebar()
-        await self.load_conversation(0)
+        for idx in range(len(self.conversations)):
+            self._append_sidebar_item(idx)
+        self.sidebar_list.index = self.current_conversation
+        await self.load_conversation(self.current_conversation)
         self.input.focus()
         self.update_title()
 
+    async def on_unmount(self):
+        await _client.aclose()
+        self.store.close()
+
     # -------------
     # Theme + model
     # -------------
@@ -274,29 +600,81 @@ class ChatApp(App):
     # Sidebar / conversations
     # -------------
 
-    def refresh_sidebar(self):
-        self.sidebar_list.clear()
-        for idx, conv in enumerate(self.conversations):
-            if conv:
-                first = conv[0]["content"].strip().replace("\n", " ")
-                title = first[:20] + ("…" if len(first) > 20 else "")
-            else:
-                title = f"Conversation {idx + 1}"
-            self.sidebar_list.append(ConversationItem(title, idx))
+    def _append_sidebar_item(self, idx: int):
+        title = self._titles[idx] or f"Conversation {idx + 1}"
+        self.sidebar_list.append(ConversationItem(title, idx))
+
+    def _update_sidebar_item(self, idx: int, title: str):
+        self._titles[idx] = title
+        self.store.set_title(self.conversations[idx], title)
+        self.sidebar_list.children[idx].query_one(Label).update(title)
 
     async def load_conversation(self, index: int):
-        # Clear chat safely for all Textual versions
-        for child in list(self.chat_view.children):
-            child.remove()
+        # Tear down the old bubbles in one batch
+        await self.chat_view.remove_children()
+        self._older_item = None
 
-        # Reload messages
-        for msg in self.conversations[index]:
+        # Reload only the most recent window of messages
+        conv = self.conversations[index]
+        self._rendered_start = max(0, len(conv) - self.WINDOW)
+        self.update_older_item()
+        for msg in conv.tail(self.WINDOW):
             await self.add_message_widget(msg["content"], msg["role"] == "user", from_history=True)
 
+        # Replies are only saved once they finish; show any still streaming
+        for reply in self._streaming.get(index, []):
+            reply["widget"] = ChatMessage(reply["text"], is_user=False)
+            self.chat_view.mount(reply["widget"])
+        self.update_typing_indicator()
+
+    def update_older_item(self):
+        """Show, update or drop the "older messages" placeholder."""
+        hidden = self._rendered_start
+        if not hidden:
+            if self._older_item is not None:
+                self._older_item.remove()
+                self._older_item = None
+            return
+
+        if self._older_item is None:
+            self._older_item = LoadOlderItem()
+            if self.chat_view.children:
+                self.chat_view.mount(self._older_item, before=0)
+            else:
+                self.chat_view.mount(self._older_item)
+        self._older_item.set_hidden(hidden)
+
+    async def action_load_older(self):
+        if not self._rendered_start:
+            return
+
+        conv = self.conversations[self.current_conversation]
+        start = max(0, self._rendered_start - self.WINDOW)
+        widgets = [
+            ChatMessage(msg["content"], is_user=msg["role"] == "user")
+            for msg in conv.page(start, self._rendered_start)
+        ]
+        await self.chat_view.mount_all(widgets, after=self._older_item)
+
+        self._rendered_start = start
+        self.update_older_item()
+
+    def trim_chat_window(self):
+        """Unmount the oldest bubbles once the chat grows well past WINDOW."""
+        bubbles = [child for child in self.chat_view.children if isinstance(child, ChatMessage)]
+        if len(bubbles) <= self.WINDOW * 1.5:
+            return
+
+        excess = len(bubbles) - self.WINDOW
+        self.chat_view.remove_children(bubbles[:excess])
+        self._rendered_start += excess
+        self.update_older_item()
+
     def action_new_conversation(self):
-        self.conversations.append([])
+        self.conversations.append(self.store.new_conversation())
+        self._titles.append(None)
         self.current_conversation = len(self.conversations) - 1
-        self.refresh_sidebar()
+        self._append_sidebar_item(self.current_conversation)
         self.call_later(self.load_conversation, self.current_conversation)
 
     async def on_list_view_selected(self, event: ListView.Selected):
@@ -333,9 +711,16 @@ class ChatApp(App):
         conv.append({"role": "user", "content": content})
 
         await self.add_message_widget(content, is_user=True)
-        self.refresh_sidebar()
+        self.trim_chat_window()
 
-        self.typing_indicator.display = True
+        # The title only changes with the first message of a conversation
+        if len(conv) == 1:
+            first = content[:64].replace("\n", " ").strip()
+            title = first[:20] + ("…" if len(first) > 20 else "")
+            self._update_sidebar_item(self.current_conversation, title)
+
+        self._pending.add(self.current_conversation)
+        self.update_typing_indicator()
         asyncio.create_task(self.handle_bot_reply())
 
     async def handle_bot_reply(self):
@@ -343,84 +728,84 @@ class ChatApp(App):
         conv = self.conversations[index]
         model = OPENROUTER_MODELS[self.current_model_index]
 
+        reply = {"widget": ChatMessage("", is_user=False), "text": ""}
+        self.chat_view.mount(reply["widget"])
+        self._streaming.setdefault(index, []).append(reply)
+
         try:
-            full_reply = await ask_ai_async(conv, model)
+            async for chunk in ask_ai_async(build_context(conv), model):
+                if not reply["text"]:
+                    self._pending.discard(index)
+                    self.update_typing_indicator()
+                # Only update the bubble if user is still in this conversation
+                if self.current_conversation == index:
+                    reply["widget"].append_text(chunk)
+                    self.scroll_chat_end()
+                reply["text"] += chunk
         except Exception as e:
-            full_reply = f"(Error: {e})"
-
-        # Save to conversation history
-        conv.append({"role": "assistant", "content": full_reply})
-
-        # Only stream if user is still in this conversation
-        if self.current_conversation == index:
-            self.typing_indicator.display = False
-            await self.stream_bot_reply(full_reply)
+            # Shown in the bubble only; errors are never saved or sent to the model
+            if self.current_conversation == index:
+                reply["widget"].append_text(f"(Error: {e})")
 
-    async def stream_bot_reply(self, reply: str):
-        """Smooth typewriter streaming effect."""
-        widget = ChatMessage("", is_user=False)
-        self.chat_view.mount(widget)
+        self._pending.discard(index)
+        self.update_typing_indicator()
 
-        chunk_size = 4  # smaller chunks = smoother typing
-        for i in range(0, len(reply), chunk_size):
-            widget.append_text(reply[i:i+chunk_size])
+        self._streaming[index].remove(reply)
+        if not self._streaming[index]:
+            del self._streaming[index]
 
-            # Scroll to bottom
-            if hasattr(self.chat_view, "scroll_end"):
-                try:
-                    self.chat_view.scroll_end()
-                except:
-                    pass
+        # Save to conversation history
+        if reply["text"]:
+            conv.append({"role": "assistant", "content": reply["text"]})
 
-            await asyncio.sleep(0.015)
+    def update_typing_indicator(self):
+        """Show the indicator only while the open conversation awaits a reply."""
+        if self.current_conversation in self._pending:
+            self.typing_indicator.show()
+        else:
+            self.typing_indicator.hide()
 
+    def scroll_chat_end(self):
+        if hasattr(self.chat_view, "scroll_end"):
+            try:
+                self.chat_view.scroll_end()
+            except:
+                pass
 
     # -------------
     # Copy & export
     # -------------
 
-    def action_copy_bot(self):
-        conv = self.conversations[self.current_conversation]
-        for msg in reversed(conv):
-            if msg["role"] == "assistant":
-                pyperclip.copy(msg["content"])
-                self.typing_indicator.update("[green]Copied last bot message[/green]")
-                return
-        self.typing_indicator.update("[red]No bot message to copy[/red]")
-
-    def action_copy_user(self):
-        conv = self.conversations[self.current_conversation]
-        for msg in reversed(conv):
-            if msg["role"] == "user":
-                pyperclip.copy(msg["content"])
-                self.typing_indicator.update("[green]Copied last user message[/green]")
-                return
-        self.typing_indicator.update("[red]No user message to copy[/red]")
-
-    def action_copy_all(self):
+    async def action_copy_bot(self):
+        content = self.conversations[self.current_conversation].last("assistant")
+        if content is None:
+            self.typing_indicator.update("[red]No bot message to copy[/red]")
+            return
+        await asyncio.to_thread(_copy, content)
+        self.typing_indicator.update("[green]Copied last bot message[/green]")
+
+    async def action_copy_user(self):
+        content = self.conversations[self.current_conversation].last("user")
+        if content is None:
+            self.typing_indicator.update("[red]No user message to copy[/red]")
+            return
+        await asyncio.to_thread(_copy, content)
+        self.typing_indicator.update("[green]Copied last user message[/green]")
+
+    async def action_copy_all(self):
         conv = self.conversations[self.current_conversation]
-        text = "\n\n".join(
-            (f"You: {m['content']}" if m["role"] == "user" else f"Bot: {m['content']}")
-            for m in conv
-        )
-        pyperclip.copy(text)
+        await asyncio.to_thread(copy_conversation, conv)
         self.typing_indicator.update("[green]Copied entire conversation[/green]")
 
-    def action_export_conversation(self):
+    async def action_export_conversation(self):
         conv = self.conversations[self.current_conversation]
         if not conv:
             self.typing_indicator.update("[red]Nothing to export[/red]")
             return
 
-        text = "\n\n".join(
-            (f"You: {m['content']}" if m["role"] == "user" else f"Bot: {m['content']}")
-            for m in conv
-        )
-
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"conversation_{timestamp}.txt"
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(text)
+        await asyncio.to_thread(export_conversation, filename, conv)
 
         self.typing_indicator.update(f"[green]Exported to {filename}[/green]")
 
@@ -429,7 +814,8 @@ class ChatApp(App):
     # -------------
 
     async def on_key(self, event: events.Key):
-        if event.key not in ("up", "down", "left", "right", "tab"):
+        # Skip the focus machinery entirely while typing into the input
+        if self.focused is not self.input and event.key not in ("up", "down", "left", "right", "tab"):
             self.input.focus()
 
 